@@ -0,0 +1,3 @@
+from maskmail.cli import cli
+
+__all__ = ["cli"]
@@ -0,0 +1,222 @@
+import contextlib
+import email.utils
+import hashlib
+import os
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+from maskmail.models import GetRequest, GetResponse, Session, SetRequest, SetResponse
+from maskmail.state import MaskedEmailState
+
+SESSION_URL = "https://api.fastmail.com/jmap/session"
+CAP_CORE = "urn:ietf:params:jmap:core"
+CAP_MASKED_EMAIL = "https://www.fastmail.com/dev/maskedemail"
+SESSION_CACHE_TTL = 24 * 60 * 60
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+# Raised by orjson.loads and the from_jmap helpers on invalid or wrongly
+# shaped JSON.
+MALFORMED_ERRORS = (AttributeError, LookupError, TypeError, ValueError)
+
+
+class MalformedResponseError(Exception):
+    pass
+
+
+class RetryTransport(httpx.BaseTransport):
+    # Only GET requests are retried on a transient status code, because
+    # repeating a MaskedEmail/set call could create duplicate masked emails.
+    # Connection failures are retried by the wrapped transport itself. A
+    # server asking to wait longer than max_retry_after gets its error
+    # response passed through instead of hanging the CLI.
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int,
+        backoff_factor: float,
+        max_retry_after: float,
+    ) -> None:
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_after = max_retry_after
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.transport.handle_request(request)
+        if request.method != "GET":
+            return response
+
+        for attempt in range(self.retries):
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+            retry_after = get_retry_after(response)
+            if retry_after is not None and retry_after > self.max_retry_after:
+                break
+            response.close()
+            if retry_after is None:
+                retry_after = self.backoff_factor * 2**attempt
+            time.sleep(retry_after)
+            response = self.transport.handle_request(request)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+def get_retry_after(response: httpx.Response) -> float | None:
+    # The Retry-After header holds either a number of seconds or an HTTP date.
+    value = response.headers.get("Retry-After")
+    if response.status_code not in RETRY_AFTER_STATUS_CODES or value is None:
+        return None
+
+    value = value.strip()
+    try:
+        if value.isdigit():
+            return int(value)
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def make_headers(api_token: str) -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json; charset=utf-8",
+    }
+
+
+def make_http_client(api_token: str, timeout: int) -> httpx.Client:
+    transport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=4),
+        retries=3,
+    )
+    return httpx.Client(
+        transport=RetryTransport(
+            transport, retries=3, backoff_factor=0.2, max_retry_after=timeout
+        ),
+        headers=make_headers(api_token),
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+def make_payload(method: str, arguments: dict[str, Any]) -> bytes:
+    return orjson.dumps(
+        {
+            "using": [CAP_CORE, CAP_MASKED_EMAIL],
+            "methodCalls": [[method, arguments, "a"]],
+        }
+    )
+
+
+def get_session_cache_path(api_token: str) -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    token_hash = hashlib.sha256(api_token.encode()).hexdigest()
+    return Path(cache_home) / "maskmail" / f"session-{token_hash}.json"
+
+
+def read_cached_session(path: Path) -> Session | None:
+    try:
+        if time.time() - path.stat().st_mtime >= SESSION_CACHE_TTL:
+            return None
+        return Session.from_jmap(orjson.loads(path.read_bytes()))
+    except (OSError, *MALFORMED_ERRORS):
+        return None
+
+
+def write_cached_session(path: Path, content: bytes) -> None:
+    # Write to a temporary file first so that a concurrent invocation never
+    # reads a partially written cache. Failing to cache is not an error.
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(content)
+        Path(f.name).replace(path)
+
+
+def invalidate_cached_session(api_token: str) -> None:
+    with contextlib.suppress(OSError):
+        get_session_cache_path(api_token).unlink(missing_ok=True)
+
+
+def get_session(http_client: httpx.Client, api_token: str) -> Session:
+    cache_path = get_session_cache_path(api_token)
+    if (session := read_cached_session(cache_path)) is not None:
+        return session
+
+    response = http_client.get(SESSION_URL)
+    response.raise_for_status()
+    try:
+        session = Session.from_jmap(orjson.loads(response.content))
+    except MALFORMED_ERRORS as e:
+        raise MalformedResponseError("Malformed session response") from e
+    write_cached_session(cache_path, response.content)
+    return session
+
+
+def send_get_request(
+    http_client: httpx.Client,
+    url: str,
+    request: GetRequest,
+    state: MaskedEmailState | None,
+) -> GetResponse:
+    payload = make_payload(
+        "MaskedEmail/get",
+        {
+            "accountId": request.account_id,
+            "ids": request.ids,
+            "properties": request.properties,
+        },
+    )
+    response = http_client.post(url, content=payload)
+    response.raise_for_status()
+    try:
+        body = orjson.loads(response.content)
+        return GetResponse.from_jmap(body["methodResponses"][0][1], state)
+    except MALFORMED_ERRORS as e:
+        raise MalformedResponseError("Malformed MaskedEmail/get response") from e
+
+
+def send_set_request(
+    http_client: httpx.Client, url: str, request: SetRequest
+) -> SetResponse:
+    create = request.create
+    payload = make_payload(
+        "MaskedEmail/set",
+        {
+            "accountId": request.account_id,
+            "ifInState": request.if_in_state,
+            "create": (
+                None
+                if create is None
+                else {
+                    creation_id: masked_email.model_dump(
+                        by_alias=True, exclude_none=True
+                    )
+                    for creation_id, masked_email in create.items()
+                }
+            ),
+            "update": request.update,
+            "destroy": request.destroy,
+        },
+    )
+    response = http_client.post(url, content=payload)
+    response.raise_for_status()
+    try:
+        body = orjson.loads(response.content)
+        return SetResponse.from_jmap(body["methodResponses"][0][1])
+    except MALFORMED_ERRORS as e:
+        raise MalformedResponseError("Malformed MaskedEmail/set response") from e
@@ -0,0 +1,214 @@
+import sys
+from typing import TYPE_CHECKING
+
+import click
+from click import Context
+
+from maskmail.state import MaskedEmailState
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def get_http_client(ctx: Context) -> "httpx.Client":
+    # Built by the subcommands rather than the group callback, so that the
+    # HTTP and model modules are not imported until the subcommand's own
+    # options have been parsed (--help, usage errors).
+    from maskmail.api import make_http_client
+
+    http_client = make_http_client(ctx.obj["api_token"], ctx.obj["timeout"])
+    ctx.call_on_close(http_client.close)
+    return http_client
+
+
+@click.group()
+@click.option(
+    "--api-token",
+    type=str,
+    envvar="MASKMAIL_API_TOKEN",
+    required=True,
+    help="{} {}".format(
+        "FastMail API token with Masked Email capabilities.",
+        "The MASKMAIL_API_TOKEN environment variable should be preferred.",
+    ),
+)
+@click.option(
+    "--timeout",
+    type=int,
+    default=5,
+    help="Timeout for the API calls in seconds",
+)
+@click.pass_context
+def cli(ctx: Context, api_token: str, timeout: int) -> None:
+    ctx.ensure_object(dict)
+    ctx.obj["api_token"] = api_token
+    ctx.obj["timeout"] = timeout
+
+
+@cli.command()
+@click.option(
+    "--domain",
+    type=str,
+    required=True,
+    help="Domain this masked email is for, in the format 'https://www.example.com'",
+)
+@click.option(
+    "--description",
+    type=str,
+    required=True,
+    help="Description of the masked email's usage",
+)
+@click.pass_context
+def create(ctx: Context, domain: str, description: str) -> None:
+    from httpx import HTTPStatusError, TimeoutException
+
+    from maskmail.api import (
+        CAP_MASKED_EMAIL,
+        RETRY_STATUS_CODES,
+        MalformedResponseError,
+        get_session,
+        invalidate_cached_session,
+        send_set_request,
+    )
+    from maskmail.models import MaskedEmail, SetRequest
+
+    api_token = ctx.obj["api_token"]
+    http_client = get_http_client(ctx)
+
+    try:
+        session = get_session(http_client, api_token)
+    except TimeoutException:
+        click.echo("Timed out when querying the session", err=True)
+        sys.exit(1)
+    except MalformedResponseError:
+        click.echo("Error validating the session response", err=True)
+        sys.exit(1)
+
+    request = SetRequest(
+        account_id=session.primary_accounts[CAP_MASKED_EMAIL],
+        if_in_state=None,
+        create={
+            "new_masked_email": MaskedEmail.model_construct(  # type: ignore[call-arg]
+                state=MaskedEmailState.PENDING,
+                for_domain=domain,
+                description=description,
+            ),
+        },
+        update=None,
+        destroy=None,
+    )
+
+    try:
+        response = send_set_request(http_client, session.api_url, request)
+    except TimeoutException:
+        click.echo("Timed out when attempting to create the masked email", err=True)
+        sys.exit(1)
+    except HTTPStatusError as e:
+        # The cached session may carry a stale API URL or account id, but a
+        # transient error says nothing about the session.
+        if e.response.status_code not in RETRY_STATUS_CODES:
+            invalidate_cached_session(api_token)
+        raise
+    except MalformedResponseError:
+        invalidate_cached_session(api_token)
+        click.echo("Error validating the masked email creation response", err=True)
+        sys.exit(1)
+
+    if response.created:
+        click.echo(response.created["new_masked_email"].email)
+    else:
+        click.echo("Error: No address was created", err=True)
+
+
+@cli.command()
+@click.option(
+    "--state",
+    type=click.Choice(MaskedEmailState),  # type: ignore[arg-type]
+    help="Only list masked emails in this state",
+)
+@click.option(
+    "--json",
+    type=bool,
+    is_flag=True,
+    default=False,
+    help="Output to JSON instead of a table",
+)
+@click.pass_context
+def show(ctx: Context, state: MaskedEmailState | None, json: bool) -> None:
+    from httpx import HTTPStatusError, TimeoutException
+
+    from maskmail.api import (
+        CAP_MASKED_EMAIL,
+        RETRY_STATUS_CODES,
+        MalformedResponseError,
+        get_session,
+        invalidate_cached_session,
+        send_get_request,
+    )
+    from maskmail.models import GetRequest
+
+    api_token = ctx.obj["api_token"]
+    http_client = get_http_client(ctx)
+
+    try:
+        session = get_session(http_client, api_token)
+    except TimeoutException:
+        click.echo("Timed out when querying the session", err=True)
+        sys.exit(1)
+    except MalformedResponseError:
+        click.echo("Error validating the session response", err=True)
+        sys.exit(1)
+
+    request = GetRequest(
+        account_id=session.primary_accounts[CAP_MASKED_EMAIL],
+        ids=None,
+        properties=["id", "email", "state", "forDomain", "description"],
+    )
+
+    try:
+        response = send_get_request(http_client, session.api_url, request, state)
+    except TimeoutException:
+        click.echo("Timed out when attempting to list masked emails", err=True)
+        sys.exit(1)
+    except HTTPStatusError as e:
+        # The cached session may carry a stale API URL or account id, but a
+        # transient error says nothing about the session.
+        if e.response.status_code not in RETRY_STATUS_CODES:
+            invalidate_cached_session(api_token)
+        raise
+    except MalformedResponseError:
+        invalidate_cached_session(api_token)
+        click.echo("Error validating the masked email listing response", err=True)
+        sys.exit(1)
+
+    if json:
+        from json import dumps
+
+        rows = [
+            {
+                "Email": masked_email.email,
+                "State": masked_email.state,
+                "Domain": masked_email.for_domain,
+                "Description": masked_email.description,
+            }
+            for masked_email in response.masked_emails
+        ]
+        click.echo(dumps(rows, indent=4, sort_keys=True))
+    else:
+        from prettytable import PrettyTable
+
+        table = PrettyTable(
+            align="r", field_names=["Email", "State", "Domain", "Description"]
+        )
+
+        for masked_email in response.masked_emails:
+            table.add_row(
+                [
+                    masked_email.email,
+                    masked_email.state,
+                    masked_email.for_domain,
+                    masked_email.description,
+                ]
+            )
+
+        click.echo(table)
@@ -0,0 +1,201 @@
+import re
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+from maskmail.state import MaskedEmailState
+
+Id = Annotated[
+    str,
+    StringConstraints(
+        min_length=1, max_length=255, pattern=re.compile(r"[A-Za-z0-9\-_]+")
+    ),
+]
+
+
+class Account(BaseModel):
+    name: str
+    is_personal: bool = Field(alias="isPersonal")
+    is_read_only: bool = Field(alias="isReadOnly")
+    account_capabilities: dict[str, Any] = Field(alias="accountCapabilities")
+
+    @classmethod
+    def from_jmap(cls, data: dict[str, Any]) -> "Account":
+        return cls.model_construct(
+            name=data["name"],
+            is_personal=data["isPersonal"],
+            is_read_only=data["isReadOnly"],
+            account_capabilities=data["accountCapabilities"],
+        )
+
+
+class Session(BaseModel):
+    capabilities: dict[str, Any]
+    accounts: dict[str, Account]
+    primary_accounts: dict[str, str] = Field(alias="primaryAccounts")
+    username: str
+    api_url: str = Field(alias="apiUrl")
+    download_url: str = Field(alias="downloadUrl")
+    upload_url: str = Field(alias="uploadUrl")
+    event_source_url: str = Field(alias="eventSourceUrl")
+    state: str
+
+    @classmethod
+    def from_jmap(cls, data: dict[str, Any]) -> "Session":
+        return cls.model_construct(
+            capabilities=data["capabilities"],
+            accounts={
+                account_id: Account.from_jmap(account)
+                for account_id, account in data["accounts"].items()
+            },
+            primary_accounts=data["primaryAccounts"],
+            username=data["username"],
+            api_url=data["apiUrl"],
+            download_url=data["downloadUrl"],
+            upload_url=data["uploadUrl"],
+            event_source_url=data["eventSourceUrl"],
+            state=data["state"],
+        )
+
+
+class MaskedEmail(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    masked_email_id: str = Field(alias="id")
+    email: str
+    state: MaskedEmailState | None = None
+    for_domain: str | None = Field(alias="forDomain", default=None)
+    description: str | None = None
+    last_message_at: str | None = Field(alias="lastMessageAt", default=None)
+    created_at: str | None = Field(alias="createdAt", default=None)
+    created_by: str | None = Field(alias="createdBy", default=None)
+    url: str | None = None
+    email_prefix: str | None = Field(alias="emailPrefix", default=None)
+
+    @classmethod
+    def from_jmap(cls, data: dict[str, Any]) -> "MaskedEmail":
+        state = data.get("state")
+        return cls.model_construct(
+            masked_email_id=data["id"],
+            email=data["email"],
+            state=None if state is None else MaskedEmailState(state),
+            for_domain=data.get("forDomain"),
+            description=data.get("description"),
+            last_message_at=data.get("lastMessageAt"),
+            created_at=data.get("createdAt"),
+            created_by=data.get("createdBy"),
+            url=data.get("url"),
+            email_prefix=data.get("emailPrefix"),
+        )
+
+
+class GetRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    account_id: Id = Field(alias="accountId")
+    ids: list[Id] | None
+    properties: list[str] | None
+
+
+class GetResponse(BaseModel):
+    account_id: str = Field(alias="accountId")
+    state: str
+    masked_emails: list[MaskedEmail] = Field(alias="list")
+    not_found: list[str] = Field(alias="notFound")
+
+    @classmethod
+    def from_jmap(
+        cls, data: dict[str, Any], state: MaskedEmailState | None = None
+    ) -> "GetResponse":
+        # Masked emails in other states are skipped before being constructed.
+        masked_emails = data["list"]
+        if state is not None:
+            masked_emails = [
+                masked_email
+                for masked_email in masked_emails
+                if masked_email.get("state") == state
+            ]
+
+        return cls.model_construct(
+            account_id=data["accountId"],
+            state=data["state"],
+            masked_emails=[
+                MaskedEmail.from_jmap(masked_email) for masked_email in masked_emails
+            ],
+            not_found=data["notFound"],
+        )
+
+
+class SetRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    account_id: Id = Field(alias="accountId")
+    if_in_state: str | None = Field(alias="ifInState")
+    create: dict[Id, MaskedEmail] | None
+    update: dict[Id, list[str]] | None
+    destroy: list[Id] | None
+
+
+class SetError(BaseModel):
+    error_type: str = Field(alias="type")
+    description: str | None
+
+    @classmethod
+    def from_jmap(cls, data: dict[str, Any]) -> "SetError":
+        return cls.model_construct(
+            error_type=data["type"], description=data.get("description")
+        )
+
+    @classmethod
+    def from_jmap_map(cls, data: dict[str, Any] | None) -> dict[str, "SetError"] | None:
+        if data is None:
+            return None
+        return {set_id: cls.from_jmap(error) for set_id, error in data.items()}
+
+
+class SetResponse(BaseModel):
+    account_id: str = Field(alias="accountId")
+    old_state: str | None = Field(alias="oldState")
+    new_state: str | None = Field(alias="newState")
+    created: dict[str, MaskedEmail] | None
+    updated: dict[str, MaskedEmail | None] | None
+    destroyed: list[str] | None
+    not_created: dict[str, SetError] | None = Field(alias="notCreated", default=None)
+    not_updated: dict[str, SetError] | None = Field(alias="notUpdated", default=None)
+    not_destroyed: dict[str, SetError] | None = Field(
+        alias="notDestroyed", default=None
+    )
+
+    @classmethod
+    def from_jmap(cls, data: dict[str, Any]) -> "SetResponse":
+        created = data["created"]
+        updated = data["updated"]
+        return cls.model_construct(
+            account_id=data["accountId"],
+            old_state=data["oldState"],
+            new_state=data["newState"],
+            created=(
+                None
+                if created is None
+                else {
+                    creation_id: MaskedEmail.from_jmap(masked_email)
+                    for creation_id, masked_email in created.items()
+                }
+            ),
+            updated=(
+                None
+                if updated is None
+                else {
+                    masked_email_id: (
+                        None
+                        if masked_email is None
+                        else MaskedEmail.from_jmap(masked_email)
+                    )
+                    for masked_email_id, masked_email in updated.items()
+                }
+            ),
+            destroyed=data["destroyed"],
+            not_created=SetError.from_jmap_map(data.get("notCreated")),
+            not_updated=SetError.from_jmap_map(data.get("notUpdated")),
+            not_destroyed=SetError.from_jmap_map(data.get("notDestroyed")),
+        )
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class MaskedEmailState(StrEnum):
+    PENDING = "pending"
+    ENABLED = "enabled"
+    DISABLED = "disabled"
+    DELETED = "deleted"
@@ -0,0 +1,145 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from maskmail.api import RetryTransport, get_retry_after
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    slept: list[float] = []
+    monkeypatch.setattr("maskmail.api.time.sleep", slept.append)
+    return slept
+
+
+def make_client(
+    responses: list[httpx.Response], requests: list[httpx.Request]
+) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    transport = RetryTransport(
+        httpx.MockTransport(handler), retries=3, backoff_factor=0.2, max_retry_after=5
+    )
+    return httpx.Client(transport=transport)
+
+
+def test_retries_get_with_backoff(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client(
+        [httpx.Response(503), httpx.Response(502), httpx.Response(200)], requests
+    )
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert sleeps == [0.2, 0.4]
+
+
+def test_gives_up_after_retries(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client([httpx.Response(500) for _ in range(4)], requests)
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 500
+    assert len(requests) == 4
+    assert sleeps == [0.2, 0.4, 0.8]
+
+
+def test_does_not_retry_post(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client([httpx.Response(503)], requests)
+
+    response = client.post("https://example.com")
+
+    assert response.status_code == 503
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+def test_does_not_retry_other_errors(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client([httpx.Response(401)], requests)
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 401
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+def test_uses_retry_after(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client(
+        [httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)],
+        requests,
+    )
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 200
+    assert sleeps == [3]
+
+
+def test_gives_up_when_retry_after_exceeds_limit(sleeps: list[float]) -> None:
+    requests: list[httpx.Request] = []
+    client = make_client(
+        [httpx.Response(429, headers={"Retry-After": "3600"})], requests
+    )
+
+    response = client.get("https://example.com")
+
+    assert response.status_code == 429
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    ("status_code", "value", "expected"),
+    [
+        (429, "3", 3),
+        (503, " 7 ", 7),
+        (429, "0", 0),
+        (429, "-3", None),
+        (429, "1.5", None),
+        (429, "²", None),
+        (429, "soon", None),
+        (500, "3", None),
+    ],
+)
+def test_get_retry_after_seconds(
+    status_code: int, value: str, expected: float | None
+) -> None:
+    # Encoded by hand, as httpx only accepts ASCII header values given as str.
+    response = httpx.Response(status_code, headers=[(b"Retry-After", value.encode())])
+    assert get_retry_after(response) == expected
+
+
+def test_get_retry_after_missing() -> None:
+    assert get_retry_after(httpx.Response(429)) is None
+
+
+def test_get_retry_after_http_date() -> None:
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+    response = httpx.Response(
+        503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+    )
+
+    retry_after = get_retry_after(response)
+
+    assert retry_after is not None
+    assert 28 <= retry_after <= 30
+
+
+def test_get_retry_after_http_date_in_past() -> None:
+    retry_at = datetime.now(UTC) - timedelta(minutes=5)
+    response = httpx.Response(
+        503, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+    )
+
+    assert get_retry_after(response) == 0.0